@@ -1,11 +1,42 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
-import numpy_financial as npf
 import pandas as pd
+from numba import njit, types
 
-def calculate_npv(net_cash_flows, discount_rate):
+# Explicit kernel signatures compile (or load from cache) at import rather
+# than on the first call. Contiguous float64 arrays are declared read-only so
+# both the cached discount vectors and ordinary writable arrays match.
+_F8_ARRAY = types.Array(types.float64, 1, "C", readonly=True)
+
+
+def _discount_factors(discount_rate: float, periods: int, dtype=np.float64) -> np.ndarray:
+    """Return the read-only factors ``(1 + p) ** -t`` for ``t = 1 .. periods``.
+
+    Scenario sweeps call the financial functions repeatedly with the same
+    rate and horizon, so the vector is cached and shared between callers.
+    The product is always accumulated in double precision and only then
+    cast to ``dtype``.
+    """
+    # Plain floats keep the cache key hashable (0-d arrays are not) and let
+    # equal NumPy and Python rates share one entry. np.dtype(...) does the
+    # same for np.float64 and dtype('float64'), which hash differently.
+    return _cached_discount_factors(float(discount_rate), int(periods), np.dtype(dtype))
+
+
+@lru_cache(maxsize=128)
+def _cached_discount_factors(discount_rate: float, periods: int, dtype) -> np.ndarray:
+    # A running product of 1 / (1 + p) avoids a pow() per period
+    factors = np.full(periods, 1.0 / (1.0 + discount_rate))
+    np.cumprod(factors, out=factors)
+    factors = factors.astype(dtype, copy=False)
+    factors.setflags(write=False)
+    return factors
+
+
+def calculate_npv(net_cash_flows, discount_rate, dtype=np.float64):
     """
     Calculates the Net Present Value (NPV) for a project.
 
@@ -17,17 +48,19 @@ def calculate_npv(net_cash_flows, discount_rate):
                                           each period t. Cash outflows should be negative.
         discount_rate (float): The discount rate (p) for the calculation, 
                                expressed as a decimal (e.g., 0.05 for 5%).
+        dtype (np.dtype, optional): Floating point type used for the sum. 
+                                    ``np.float32`` halves memory traffic in large 
+                                    sweeps at a relative error of about 1e-6.
 
     Returns:
         float: The calculated Net Present Value of the project.
     """
-    npv = 0
-    for t, ncf in enumerate(net_cash_flows):
-        # The formula uses t=1 to n, so we use t+1 in the denominator
-        npv += ncf / ((1 + discount_rate) ** (t + 1))
-    return npv
+    ncf = np.asarray(net_cash_flows, dtype=dtype)
+    # The formula uses t=1 to n, which is how the discount factors are indexed
+    return float(ncf @ _discount_factors(discount_rate, ncf.size, ncf.dtype))
 
-def calculate_lcoe(investment_costs, operation_costs, energy_production, discount_rate, residual_value=0):
+def calculate_lcoe(investment_costs, operation_costs, energy_production, discount_rate, residual_value=0,
+                   dtype=np.float64):
     """
     Calculates the Levelized Cost of Energy (LCOE).
 
@@ -41,6 +74,9 @@ def calculate_lcoe(investment_costs, operation_costs, energy_production, discoun
         discount_rate (float): The discount rate (p) for the calculation, as a decimal.
         residual_value (float, optional): The value of non-amortized assets (WM_n) 
                                           at the end of the analysis period. Defaults to 0.
+        dtype (np.dtype, optional): Floating point type used for the sums. 
+                                    ``np.float32`` is adequate for 50-year horizons 
+                                    at typical discount rates (relative error ~1e-6).
 
     Returns:
         float: The calculated Levelized Cost of Energy, typically in currency per MWh.
@@ -49,17 +85,21 @@ def calculate_lcoe(investment_costs, operation_costs, energy_production, discoun
     if not (len(investment_costs) == len(operation_costs) == len(energy_production)):
         raise ValueError("Input lists for costs and production must have the same length.")
     
-    analysis_period_n = len(investment_costs)
-    
+    investments = np.asarray(investment_costs, dtype=dtype)
+    operations = np.asarray(operation_costs, dtype=dtype)
+    energy = np.asarray(energy_production, dtype=dtype)
+    analysis_period_n = investments.size
+
+    # One discount vector shared by every sum (t=1 to n)
+    discount = _discount_factors(discount_rate, analysis_period_n, investments.dtype)
+
     # Calculate the numerator: Sum of discounted costs
-    discounted_investments = sum(investment_costs[t] / ((1 + discount_rate) ** (t + 1)) for t in range(analysis_period_n))
-    discounted_operations = sum(operation_costs[t] / ((1 + discount_rate) ** (t + 1)) for t in range(analysis_period_n))
-    discounted_residual_value = residual_value / ((1 + discount_rate) ** analysis_period_n)
-    
-    total_discounted_costs = discounted_investments + discounted_operations - discounted_residual_value
+    # The last factor is (1 + p) ** -n, exactly the residual value's discount
+    discounted_residual_value = residual_value * discount[-1] if analysis_period_n else 0.0
+    total_discounted_costs = (investments + operations) @ discount - discounted_residual_value
 
     # Calculate the denominator: Sum of discounted energy production
-    total_discounted_energy = sum(energy_production[t] / ((1 + discount_rate) ** (t + 1)) for t in range(analysis_period_n))
+    total_discounted_energy = energy @ discount
 
     # Avoid division by zero if no energy is produced
     if total_discounted_energy == 0:
@@ -67,20 +107,360 @@ def calculate_lcoe(investment_costs, operation_costs, energy_production, discoun
 
     # Calculate LCOE
     lcoe = total_discounted_costs / total_discounted_energy
-    return lcoe
+    return float(lcoe)
+
+def _discount_matrix(discount_rates, periods: int) -> np.ndarray:
+    """Return the factors ``(1 + p) ** -t`` for ``t = 1 .. periods``, one row per rate."""
+    rates = np.asarray(discount_rates, dtype=np.float64).reshape(-1)
+    factors = np.repeat((1.0 / (1.0 + rates))[:, None], periods, axis=1)
+    np.cumprod(factors, axis=1, out=factors)
+    return factors
+
+
+def calculate_npv_batch(net_cash_flows, discount_rates):
+    """
+    Calculates the NPV of one or more projects at several discount rates at once.
+
+    Equivalent to calling :func:`calculate_npv` for every combination of
+    cash flow series and rate, but evaluated as a single matrix product.
+
+    Args:
+        net_cash_flows (array-like): Net cash flows of shape ``(n,)`` or
+                                     ``(k, n)`` for ``k`` projects.
+        discount_rates (float or array-like): Discount rates of shape ``(m,)``.
+
+    Returns:
+        np.ndarray: NPVs of shape ``(m,)`` for a single series or ``(k, m)``.
+                    A scalar rate drops the rate axis, giving ``()`` or ``(k,)``.
+    """
+    ncf = np.asarray(net_cash_flows, dtype=np.float64)
+    npv = ncf @ _discount_matrix(discount_rates, ncf.shape[-1]).T
+    return npv[..., 0] if np.ndim(discount_rates) == 0 else npv
+
+
+def calculate_lcoe_batch(investment_costs, operation_costs, energy_production, discount_rates, residual_value=0):
+    """
+    Calculates the LCOE of one or more projects at several discount rates at once.
+
+    Equivalent to calling :func:`calculate_lcoe` for every combination of
+    schedules and rate, but evaluated as matrix products.
+
+    Args:
+        investment_costs (array-like): Investment expenditures of shape ``(n,)`` or ``(k, n)``.
+        operation_costs (array-like): Operational costs, same shape as ``investment_costs``.
+        energy_production (array-like): Energy produced, same shape as ``investment_costs``.
+        discount_rates (float or array-like): Discount rates of shape ``(m,)``.
+        residual_value (float, optional): The value of non-amortized assets at the
+                                          end of the analysis period. Defaults to 0.
+
+    Returns:
+        np.ndarray: LCOE values of shape ``(m,)`` or ``(k, m)``; ``inf`` where no
+                    energy is produced. A scalar rate drops the rate axis,
+                    giving ``()`` or ``(k,)``.
+    """
+    investments = np.asarray(investment_costs, dtype=np.float64)
+    operations = np.asarray(operation_costs, dtype=np.float64)
+    energy = np.asarray(energy_production, dtype=np.float64)
+    if not (investments.shape == operations.shape == energy.shape):
+        raise ValueError("Input lists for costs and production must have the same length.")
+
+    analysis_period_n = investments.shape[-1]
+    discount = _discount_matrix(discount_rates, analysis_period_n)
+    discounted_residual_value = residual_value * discount[:, -1] if analysis_period_n else 0.0
+    total_discounted_costs = (investments + operations) @ discount.T - discounted_residual_value
+    total_discounted_energy = energy @ discount.T
+    lcoe = np.divide(
+        total_discounted_costs,
+        total_discounted_energy,
+        out=np.full(total_discounted_costs.shape, np.inf),
+        where=total_discounted_energy != 0,
+    )
+    return lcoe[..., 0] if np.ndim(discount_rates) == 0 else lcoe
+
+
+@njit(types.UniTuple(types.float64, 2)(_F8_ARRAY, types.float64), cache=True)
+def _npv_and_slope(cash_flows, rate):
+    """Return NPV at ``rate`` (t=0 to n-1) and its derivative with respect to ``rate``."""
+    x = 1.0 / (1.0 + rate)
+    n = cash_flows.size
+    value = cash_flows[n - 1]
+    slope = 0.0
+    # Horner's scheme in x = 1 / (1 + rate), tracking d(value)/dx alongside
+    for t in range(n - 2, -1, -1):
+        slope = slope * x + value
+        value = value * x + cash_flows[t]
+    return value, -slope * x * x
+
+
+@njit(
+    types.float64(
+        _F8_ARRAY, types.float64, types.float64, types.float64, types.float64, types.int64
+    ),
+    cache=True,
+)
+def _refine_root(cash_flows, low, high, f_low, tol, maxiter):
+    """Newton iteration on a bracketing interval, bisecting whenever a step leaves it."""
+    rate = 0.5 * (low + high)
+    for _ in range(maxiter):
+        value, slope = _npv_and_slope(cash_flows, rate)
+        if value == 0.0:
+            return rate
+        if f_low * value < 0.0:
+            high = rate
+        else:
+            low = rate
+            f_low = value
+        candidate = rate - value / slope if slope != 0.0 else high
+        if not low < candidate < high:
+            candidate = 0.5 * (low + high)
+        if abs(candidate - rate) < tol:
+            return candidate
+        rate = candidate
+    return rate
+
+
+@njit(types.float64(_F8_ARRAY, types.float64), cache=True)
+def _npv_scale(cash_flows, rate):
+    """Return the discounted sum of ``|cash_flows|`` at ``rate``, the scale of NPV rounding error."""
+    x = 1.0 / (1.0 + rate)
+    n = cash_flows.size
+    value = abs(cash_flows[n - 1])
+    for t in range(n - 2, -1, -1):
+        value = value * x + abs(cash_flows[t])
+    return value
+
+
+@njit(types.float64(_F8_ARRAY, types.float64, types.float64, types.float64, types.int64), cache=True)
+def _locate_turning_point(cash_flows, low, high, slope_low, maxiter):
+    """Bisect on the sign of the NPV slope for the extremum inside ``[low, high]``."""
+    for _ in range(maxiter):
+        mid = 0.5 * (low + high)
+        if mid == low or mid == high:
+            break
+        if _npv_and_slope(cash_flows, mid)[1] * slope_low > 0.0:
+            low = mid
+        else:
+            high = mid
+    return 0.5 * (low + high)
+
+
+@njit(
+    types.float64(
+        _F8_ARRAY, types.float64, types.float64, types.float64, types.float64,
+        types.float64, types.float64, types.boolean, types.float64, types.int64,
+    ),
+    cache=True,
+)
+def _root_in_step(cash_flows, a, b, f_a, slope_a, f_b, slope_b, from_a, tol, maxiter):
+    """Return the root in ``[a, b]`` nearest ``a`` (or ``b`` if not ``from_a``), or ``nan``.
+
+    When the slope changes sign the NPV turns inside the step, so two roots,
+    or a double root, can sit between end points of the same sign. Splitting
+    at the turning point leaves two monotone halves to bracket.
+    """
+    # Scan points can land exactly on a root; Newton cannot start from a zero end
+    if f_a == 0.0 and from_a:
+        return a
+    if f_b == 0.0 and not from_a:
+        return b
+    if slope_a * slope_b <= 0.0:
+        turn = _locate_turning_point(cash_flows, a, b, slope_a, maxiter)
+        f_turn = _npv_and_slope(cash_flows, turn)[0]
+        # A turning point on zero (to within rounding) is a double root
+        if abs(f_turn) <= 1e-12 * _npv_scale(cash_flows, turn):
+            return turn
+        root_before = f_a * f_turn < 0.0
+        root_after = f_turn * f_b <= 0.0
+        if root_before and from_a:
+            return _refine_root(cash_flows, a, turn, f_a, tol, maxiter)
+        if root_after and not from_a:
+            return _refine_root(cash_flows, turn, b, f_turn, tol, maxiter)
+        if root_before:
+            return _refine_root(cash_flows, a, turn, f_a, tol, maxiter)
+        if root_after:
+            return _refine_root(cash_flows, turn, b, f_turn, tol, maxiter)
+        return a if f_a == 0.0 else np.nan
+    if f_a == 0.0:
+        return a
+    if f_a * f_b <= 0.0:
+        return _refine_root(cash_flows, a, b, f_a, tol, maxiter)
+    return np.nan
+
+
+@njit(types.float64(_F8_ARRAY, types.float64, types.int64), cache=True)
+def _irr_newton(cash_flows, tol, maxiter):
+    """Return the IRR closest to zero, or ``nan`` if there is none.
+
+    Like ``numpy_financial.irr``, the root nearest 0% is preferred when the
+    cash flows change sign more than once. Rates are scanned outward from
+    zero on both sides; each step is checked for a sign change of the NPV
+    and of its slope, and the bracketed root is refined by Newton's method.
+    """
+    if cash_flows.size == 0:
+        return np.nan
+    f_zero, slope_zero = _npv_and_slope(cash_flows, 0.0)
+    if f_zero == 0.0:
+        # Every rate solves an all-zero series, so it has no IRR
+        for t in range(cash_flows.size):
+            if cash_flows[t] != 0.0:
+                return 0.0
+        return np.nan
+
+    # Widen |rate| step by step so a root found at one step is closer to zero
+    # than anything further out on either side.
+    inner = 0.0
+    f_pos = f_neg = f_zero
+    slope_pos = slope_neg = slope_zero
+    while inner < 1e6:
+        outer = inner + max(0.002, 0.05 * inner)
+        neg_root = np.nan
+        f_next, slope_next = _npv_and_slope(cash_flows, outer)
+        pos_root = _root_in_step(
+            cash_flows, inner, outer, f_pos, slope_pos, f_next, slope_next, True, tol, maxiter
+        )
+        f_pos, slope_pos = f_next, slope_next
+        if inner < 1.0:
+            neg_outer = max(-outer, -1.0 + 1e-9)
+            f_next, slope_next = _npv_and_slope(cash_flows, neg_outer)
+            neg_root = _root_in_step(
+                cash_flows, neg_outer, -inner, f_next, slope_next, f_neg, slope_neg, False, tol, maxiter
+            )
+            f_neg, slope_neg = f_next, slope_next
+        if np.isnan(neg_root):
+            if not np.isnan(pos_root):
+                return pos_root
+        elif np.isnan(pos_root) or -neg_root < pos_root:
+            return neg_root
+        else:
+            return pos_root
+        inner = outer
+    return np.nan
+
 
 def calculate_irr(net_cash_flows):
-    """Return the Internal Rate of Return (IRR) for given cash flows."""
-    return npf.irr(net_cash_flows)
+    """Return the Internal Rate of Return (IRR) for given cash flows.
 
-def calculate_discounted_payback_period(net_cash_flows, discount_rate):
-    """Return the discounted payback period in years or None if never recovered."""
+    The rate is found by a compiled Newton solver. When the cash flows change
+    sign more than once, the IRR closest to zero is returned. Returns ``nan``
+    when no IRR exists.
+    """
+    cash_flows = np.ascontiguousarray(net_cash_flows, dtype=np.float64)
+    return float(_irr_newton(cash_flows, 1e-12, 100))
+
+@njit(types.int64(_F8_ARRAY, _F8_ARRAY), cache=True)
+def _payback_kernel(cash_flows, discount_factors):
+    """Return the first period with a non-negative cumulative discounted cash flow, or -1."""
     cumulative = 0.0
-    for t, ncf in enumerate(net_cash_flows):
-        cumulative += ncf / ((1 + discount_rate) ** t)
-        if cumulative >= 0:
+    for t in range(cash_flows.size):
+        cumulative += cash_flows[t] * discount_factors[t]
+        if cumulative >= 0.0:
             return t
-    return None
+    return -1
+
+
+def calculate_discounted_payback_period(net_cash_flows, discount_rate):
+    """Return the discounted payback period in years or None if never recovered."""
+    ncf = np.ascontiguousarray(net_cash_flows, dtype=np.float64)
+    # Discounting from t=1 as in calculate_npv scales every cumulative sum by the
+    # same positive factor, so the period at which it turns non-negative is
+    # unchanged.
+    period = _payback_kernel(ncf, _discount_factors(discount_rate, ncf.size))
+    return None if period < 0 else int(period)
+
+
+def _outage_starts(first, last, maintenance_interval_months: int) -> pd.DatetimeIndex:
+    """Return maintenance start times from ``first`` to ``last`` inclusive."""
+    return pd.date_range(
+        first, last, freq=pd.DateOffset(months=maintenance_interval_months)
+    )
+
+
+def _maintenance_mask(
+    timestamps: pd.Series, maintenance_days: float, maintenance_interval_months: int
+) -> np.ndarray:
+    """Return a boolean mask of the rows that fall inside a maintenance outage.
+
+    Outages start at the first timestamp and repeat every
+    ``maintenance_interval_months`` calendar months. Each one covers the rows
+    within ``maintenance_days`` of its start, capped at that many hours of
+    rows. ``timestamps`` must be sorted.
+    """
+    # Compare integer nanoseconds (UTC for tz-aware data) rather than
+    # Timestamp objects
+    times = timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    starts = _outage_starts(
+        timestamps.iloc[0], timestamps.iloc[-1], maintenance_interval_months
+    )
+    start_ns = starts.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    span_ns = pd.Timedelta(days=maintenance_days).value
+
+    # Row ranges [first, last) of each outage, located by binary search
+    first = np.searchsorted(times, start_ns, side="left")
+    last = np.searchsorted(times, start_ns + span_ns, side="left")
+    last = np.minimum(last, first + int(maintenance_days * 24))
+
+    # Mark range boundaries and integrate, so overlapping outages still work
+    edges = np.zeros(times.size + 1, dtype=np.int64)
+    np.add.at(edges, first, 1)
+    np.add.at(edges, last, -1)
+    return np.cumsum(edges[:-1]) > 0
+
+
+def _online_hours_by_year(
+    start, hours: int, maintenance_days: float, maintenance_interval_months: int
+) -> np.ndarray:
+    """Return the hours outside maintenance in each calendar year of an hourly run.
+
+    Closed-form counterpart of :func:`_maintenance_mask` for ``hours``
+    consecutive hourly steps from ``start``. Year boundaries and outages are
+    located as whole-hour offsets, so no per-hour arrays are built.
+    """
+    start = pd.Timestamp(start)
+    hour = pd.Timedelta(hours=1)
+    end = start + (hours - 1) * hour
+
+    def step_offsets(times):
+        # First hourly step at or after each time, as searchsorted(side="left")
+        steps = np.ceil((times - start) / hour).to_numpy()
+        return np.clip(steps, 0, hours).astype(np.int64)
+
+    year_starts = pd.date_range(
+        pd.Timestamp(year=start.year + 1, month=1, day=1), end, freq=pd.offsets.YearBegin()
+    )
+    edges = np.concatenate([[0], step_offsets(year_starts), [hours]])
+    online = np.diff(edges)
+
+    if maintenance_days > 0:
+        starts = _outage_starts(start, end, maintenance_interval_months)
+        first = step_offsets(starts)
+        last = step_offsets(starts + pd.Timedelta(days=maintenance_days))
+        last = np.minimum(last, first + int(maintenance_days * 24))
+        # Trim overlapping outages so no hour is counted twice
+        first[1:] = np.maximum(first[1:], last[:-1])
+        last = np.maximum(last, first)
+        overlap = (
+            np.minimum(last[:, None], edges[None, 1:])
+            - np.maximum(first[:, None], edges[None, :-1])
+        )
+        online = online - np.clip(overlap, 0, None).sum(axis=0)
+    return online
+
+
+def _fuel_cost_per_mwh(
+    fuel_cost_per_mwh: float | None,
+    fuel_cost_per_refueling: float | None,
+    capacity_mw: float,
+    capacity_factor: float,
+    refueling_cycle_months: int,
+) -> float:
+    """Resolve the fuel cost per MWh, converting a per-refueling cost if needed."""
+    if fuel_cost_per_mwh is not None:
+        return fuel_cost_per_mwh
+    if fuel_cost_per_refueling is None:
+        return 0.0
+    hours_per_cycle = refueling_cycle_months * 30 * 24
+    energy_per_cycle = capacity_mw * capacity_factor * hours_per_cycle
+    return fuel_cost_per_refueling / energy_per_cycle
 
 
 def simulate_plant_operation(
@@ -93,6 +473,7 @@ def simulate_plant_operation(
     *,
     fuel_cost_per_refueling: float | None = None,
     refueling_cycle_months: int = 18,
+    return_dataframe: bool = True,
 ):
     """Simulate operating a plant and selling energy.
 
@@ -118,45 +499,68 @@ def simulate_plant_operation(
         Length of a fuel cycle in months. Defaults to 18 months.
     capacity_factor : float, optional
         Operational capacity factor outside of maintenance periods.
+    return_dataframe : bool, optional
+        If ``False``, skip assembling the hourly results and return only the
+        total profit. Defaults to ``True``.
 
     Returns
     -------
-    tuple
-        Total profit and a DataFrame of the simulation results.
+    tuple or float
+        Total profit and a DataFrame of the simulation results, or just the
+        total profit when ``return_dataframe`` is ``False``. The total is
+        accumulated in float64, but the ``energy_mwh``, ``revenue``,
+        ``fuel_cost`` and ``profit`` columns are float32. Re-sum them as
+        ``results["profit"].to_numpy().sum(dtype=np.float64)`` to avoid
+        float32 accumulation error.
     """
 
     if prices.empty:
         raise ValueError("Price data required for simulation")
 
-    if fuel_cost_per_mwh is None:
-        if fuel_cost_per_refueling is None:
-            fuel_cost_per_mwh = 0.0
-        else:
-            hours_per_cycle = refueling_cycle_months * 30 * 24
-            energy_per_cycle = capacity_mw * capacity_factor * hours_per_cycle
-            fuel_cost_per_mwh = fuel_cost_per_refueling / energy_per_cycle
-
-    df = prices.copy().sort_values("timestamp").reset_index(drop=True)
-    df["energy_mwh"] = capacity_mw * capacity_factor
+    fuel_cost_per_mwh = _fuel_cost_per_mwh(
+        fuel_cost_per_mwh,
+        fuel_cost_per_refueling,
+        capacity_mw,
+        capacity_factor,
+        refueling_cycle_months,
+    )
 
-    if maintenance_days > 0:
-        downtime_hours = int(maintenance_days * 24)
-        start = df["timestamp"].iloc[0]
-        end_time = df["timestamp"].iloc[-1]
-        while start <= end_time:
-            mask = (
-                (df["timestamp"] >= start)
-                & (df["timestamp"] < start + pd.Timedelta(days=maintenance_days))
-            )
-            downtime_idx = df.index[mask][:downtime_hours]
-            df.loc[downtime_idx, "energy_mwh"] = 0.0
-            start += pd.DateOffset(months=maintenance_interval_months)
+    # Price series are normally already in time order (e.g. built with
+    # pd.date_range), so only sort when needed. Input that is already in
+    # order is only copied once a results frame is actually returned.
+    if prices["timestamp"].is_monotonic_increasing:
+        df = prices
+    else:
+        order = np.argsort(prices["timestamp"].to_numpy(), kind="stable")
+        df = prices.iloc[order].reset_index(drop=True)
 
-    df["revenue"] = df["price"] * df["energy_mwh"]
-    df["fuel_cost"] = fuel_cost_per_mwh * df["energy_mwh"]
-    df["profit"] = df["revenue"] - df["fuel_cost"]
+    # Work on plain float arrays and only fill in the DataFrame if requested.
+    # Hourly prices and volumes need far less than double precision; float32
+    # halves the memory traffic and totals are still accumulated in float64.
+    price = df["price"].to_numpy(dtype=np.float32)
 
-    total_profit = df["profit"].sum()
+    energy = np.full(price.size, capacity_mw * capacity_factor, dtype=np.float32)
+    if maintenance_days > 0:
+        downtime = _maintenance_mask(
+            df["timestamp"], maintenance_days, maintenance_interval_months
+        )
+        energy[downtime] = 0.0
+
+    revenue = price * energy
+    fuel_cost = np.float32(fuel_cost_per_mwh) * energy
+    profit = revenue - fuel_cost
+    total_profit = profit.sum(dtype=np.float64)
+    if not return_dataframe:
+        return total_profit
+
+    # The results must not share the caller's timestamp and price buffers
+    if df is prices:
+        df = prices.copy()
+        df.index = pd.RangeIndex(len(df))
+    df["energy_mwh"] = energy
+    df["revenue"] = revenue
+    df["fuel_cost"] = fuel_cost
+    df["profit"] = profit
     return total_profit, df
 
 
@@ -186,56 +590,58 @@ def run_example(params: dict) -> None:
     capacity_factor = params["capacity_factor"]
     electricity_price = params["electricity_price_usd_per_mwh"]
 
-    investment_schedule = [annual_investment] * construction_years + [0] * operational_years
+    investment_schedule = np.zeros(total_years)
+    investment_schedule[:construction_years] = annual_investment
 
-    op_cost_schedule = [0] * construction_years
-    current_cost = annual_op_cost
-    for _ in range(operational_years):
-        op_cost_schedule.append(current_cost)
-        current_cost *= 1 + op_cost_inflation
+    op_costs = annual_op_cost * (1 + op_cost_inflation) ** np.arange(operational_years)
+    op_cost_schedule = np.concatenate([np.zeros(construction_years), op_costs])
     op_cost_schedule[-1] += decommissioning
 
     # --- Simulate plant operation over the operational period ---
     hours = operational_years * 365 * 24
-    timestamps = pd.date_range("2024-01-01", periods=hours, freq="H")
-    price_df = pd.DataFrame({"timestamp": timestamps, "price": electricity_price})
-
-    fuel_cost = params.get("fuel_cost_per_mwh")
-    fuel_per_refueling = params.get("fuel_cost_per_refueling")
-    refuel_months = params.get("refueling_cycle_months", 18)
+    fuel_cost = _fuel_cost_per_mwh(
+        params.get("fuel_cost_per_mwh"),
+        params.get("fuel_cost_per_refueling"),
+        capacity_mw,
+        capacity_factor,
+        params.get("refueling_cycle_months", 18),
+    )
     maintenance_days = params.get("maintenance_days", 30)
 
-    if fuel_cost is None and fuel_per_refueling is not None:
-        hours_per_cycle = refuel_months * 30 * 24
-        cycle_energy = capacity_mw * capacity_factor * hours_per_cycle
-        fuel_cost = fuel_per_refueling / cycle_energy
-    elif fuel_cost is None:
-        fuel_cost = 0.0
-
-    _, op_df = simulate_plant_operation(
-        price_df,
-        capacity_mw=capacity_mw,
-        fuel_cost_per_mwh=fuel_cost,
-        maintenance_days=maintenance_days,
-        capacity_factor=capacity_factor,
-        maintenance_interval_months=18,
+    if np.isscalar(electricity_price):
+        # A flat price needs no hourly simulation: count online hours per year
+        online_hours = _online_hours_by_year("2024-01-01", hours, maintenance_days, 18)
+        energy_by_year = online_hours * (capacity_mw * capacity_factor)
+        revenue_by_year = energy_by_year * electricity_price
+        total_profit = energy_by_year.sum() * (electricity_price - fuel_cost)
+    else:
+        timestamps = pd.date_range("2024-01-01", periods=hours, freq="h")
+        price_df = pd.DataFrame({"timestamp": timestamps, "price": electricity_price})
+        total_profit, op_df = simulate_plant_operation(
+            price_df,
+            capacity_mw=capacity_mw,
+            fuel_cost_per_mwh=fuel_cost,
+            maintenance_days=maintenance_days,
+            capacity_factor=capacity_factor,
+            maintenance_interval_months=18,
+        )
+
+        # Years form a small dense range, so bin by offset from the first year.
+        # The results keep the (already sorted) order of ``timestamps``.
+        years = timestamps.year.to_numpy()
+        year_index = years - years.min()
+        energy_by_year = np.bincount(year_index, weights=op_df["energy_mwh"].to_numpy())
+        revenue_by_year = np.bincount(year_index, weights=op_df["revenue"].to_numpy())
+
+    # Output degrades by 0.1% per operating year
+    degrade = 0.999 ** np.arange(energy_by_year.size)
+    construction_zeros = np.zeros(construction_years)
+    energy_schedule = np.concatenate([construction_zeros, energy_by_year * degrade])
+    revenue_schedule = np.concatenate(
+        [construction_zeros, revenue_by_year * degrade / 1_000_000]
     )
 
-    op_df["year"] = op_df["timestamp"].dt.year
-    energy_by_year = op_df.groupby("year")["energy_mwh"].sum().tolist()
-    revenue_by_year = op_df.groupby("year")["revenue"].sum().tolist()
-
-    energy_schedule = [0] * construction_years
-    revenue_schedule = [0] * construction_years
-    degrade = 1.0
-    for e, r in zip(energy_by_year, revenue_by_year):
-        energy_schedule.append(e * degrade)
-        revenue_schedule.append((r * degrade) / 1_000_000)
-        degrade *= 0.999
-
-    net_cash_flows = np.array(revenue_schedule) - (
-        np.array(investment_schedule) + np.array(op_cost_schedule)
-    )
+    net_cash_flows = revenue_schedule - (investment_schedule + op_cost_schedule)
 
     lcoe_result = calculate_lcoe(
         investment_costs=investment_schedule,
@@ -251,7 +657,7 @@ def run_example(params: dict) -> None:
         f"  - Total Lifecycle: {total_years} years ({construction_years} construction + {operational_years} operation)"
     )
     print(f"  - Total Investment: ${overnight_cost:,.0f} Million")
-    if energy_by_year:
+    if energy_by_year.size:
         print(f"  - First Year Energy Output: {energy_by_year[0]:,.0f} MWh")
 
     print("\n--- Model Results ---")
@@ -282,7 +688,6 @@ def run_example(params: dict) -> None:
         print("Discounted payback period was not reached within the project life.")
 
     print("\n--- Operational Simulation ---")
-    total_profit = op_df["profit"].sum()
     print(
         f"Simulated total profit over {operational_years} years: ${total_profit:,.2f}"
     )
@@ -1,12 +1,89 @@
 import os
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache, partial
+from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from statsmodels.tsa.arima.model import ARIMA
+from urllib3.util.retry import Retry
+
+try:  # optional, faster JSON decoding for large responses
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib parser
+    orjson = None
+
+# Responses are reused for this long; the query URLs already change with
+# every new hour (hourly data) or day (daily data).
+_CACHE_TTL_SECONDS = 600
+
+# One pooled session so repeated queries reuse the TCP/TLS connection.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def _get_api_key() -> str:
+    """Return the EIA API key from ``EIA_API_KEY`` or ``secrets.json``.
+
+    The lookup runs once per process; a failed lookup raises and is retried
+    on the next call.
+    """
+    api_key = os.getenv("EIA_API_KEY")
+    if not api_key:
+        secrets_path = Path(__file__).resolve().parent / "secrets.json"
+        if secrets_path.exists():
+            try:
+                with open(secrets_path, "r", encoding="utf-8") as f:
+                    secrets = json.load(f)
+                    api_key = secrets.get("EIA_API_KEY")
+            except Exception:
+                pass
+    if not api_key:
+        raise ValueError(
+            "An EIA API key is required. Set EIA_API_KEY env variable, pass api_key argument, or create secrets.json."
+        )
+    return api_key
+
+
+@lru_cache(maxsize=64)
+def _fetch_price_frame(url: str, ttl_bucket: int) -> pd.DataFrame:
+    """Download one EIA price query and return it as a tidy DataFrame.
+
+    ``ttl_bucket`` is the current time in units of ``_CACHE_TTL_SECONDS``, so
+    cached responses expire when it changes. Callers must copy the result
+    before handing it out.
+    """
+    resp = _SESSION.get(url, timeout=10)
+    resp.raise_for_status()
+    payload = orjson.loads(resp.content) if orjson is not None else resp.json()
+    data = payload.get("response", {}).get("data", [])
+    df = pd.DataFrame(data)
+    if df.empty:
+        return df
+    df = df.rename(columns={"timestamp": "timestamp", "value": "price"})
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    df = df.sort_values("timestamp").reset_index(drop=True)
+    return df[["timestamp", "price"]]
+
+
+def _cached_price_frame(url: str) -> pd.DataFrame:
+    """Return a private copy of the (possibly cached) response for ``url``."""
+    return _fetch_price_frame(url, int(time.time() // _CACHE_TTL_SECONDS)).copy()
 
 
 def fetch_recent_prices(region: str, hours: int = 24, api_key: Optional[str] = None) -> pd.DataFrame:
@@ -27,21 +104,7 @@ def fetch_recent_prices(region: str, hours: int = 24, api_key: Optional[str] = N
     pandas.DataFrame
         DataFrame with ``timestamp`` and ``price`` columns.
     """
-    if api_key is None:
-        api_key = os.getenv("EIA_API_KEY")
-        if not api_key:
-            secrets_path = Path(__file__).resolve().parent / "secrets.json"
-            if secrets_path.exists():
-                try:
-                    with open(secrets_path, "r", encoding="utf-8") as f:
-                        secrets = json.load(f)
-                        api_key = secrets.get("EIA_API_KEY")
-                except Exception:
-                    pass
-    if not api_key:
-        raise ValueError(
-            "An EIA API key is required. Set EIA_API_KEY env variable, pass api_key argument, or create secrets.json."
-        )
+    api_key = api_key or _get_api_key()
 
     end = datetime.utcnow()
     start = end - timedelta(hours=hours)
@@ -51,17 +114,7 @@ def fetch_recent_prices(region: str, hours: int = 24, api_key: Optional[str] = N
         f"&start={start.strftime('%Y-%m-%dT%H')}&end={end.strftime('%Y-%m-%dT%H')}"
         f"&region={region}"
     )
-    resp = requests.get(url, timeout=10)
-    resp.raise_for_status()
-    payload = resp.json()
-    data = payload.get("response", {}).get("data", [])
-    df = pd.DataFrame(data)
-    if df.empty:
-        return df
-    df = df.rename(columns={"timestamp": "timestamp", "value": "price"})
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df = df.sort_values("timestamp").reset_index(drop=True)
-    return df[["timestamp", "price"]]
+    return _cached_price_frame(url)
 
 
 def fetch_daily_prices(region: str, years: int = 3, api_key: Optional[str] = None) -> pd.DataFrame:
@@ -81,43 +134,34 @@ def fetch_daily_prices(region: str, years: int = 3, api_key: Optional[str] = Non
     -------
     pandas.DataFrame
         DataFrame with ``timestamp`` and ``price`` columns at daily frequency.
-    """
 
-    if api_key is None:
-        api_key = os.getenv("EIA_API_KEY")
-        if not api_key:
-            secrets_path = Path(__file__).resolve().parent / "secrets.json"
-            if secrets_path.exists():
-                try:
-                    with open(secrets_path, "r", encoding="utf-8") as f:
-                        secrets = json.load(f)
-                        api_key = secrets.get("EIA_API_KEY")
-                except Exception:
-                    pass
-    if not api_key:
-        raise ValueError(
-            "An EIA API key is required. Set EIA_API_KEY env variable, pass api_key argument, or create secrets.json."
-        )
+    Notes
+    -----
+    The history is requested as one query per year, issued concurrently, so
+    downloading and parsing overlap instead of waiting on one large response.
+    """
+    api_key = api_key or _get_api_key()
 
     end = datetime.utcnow().date()
     start = end - timedelta(days=365 * years)
-    url = (
+    # Consecutive, non-overlapping (inclusive) date ranges; the last one ends today
+    bounds = [start + timedelta(days=365 * i) for i in range(max(years, 1))]
+    ranges = [
+        (lo, hi - timedelta(days=1)) for lo, hi in zip(bounds, bounds[1:])
+    ] + [(bounds[-1], end)]
+    urls = [
         "https://api.eia.gov/v2/electricity/rto/region-price/data/"
         f"?api_key={api_key}&data=price&frequency=daily"
-        f"&start={start.strftime('%Y-%m-%d')}&end={end.strftime('%Y-%m-%d')}"
+        f"&start={lo.strftime('%Y-%m-%d')}&end={hi.strftime('%Y-%m-%d')}"
         f"&region={region}"
-    )
-    resp = requests.get(url, timeout=10)
-    resp.raise_for_status()
-    payload = resp.json()
-    data = payload.get("response", {}).get("data", [])
-    df = pd.DataFrame(data)
-    if df.empty:
-        return df
-    df = df.rename(columns={"timestamp": "timestamp", "value": "price"})
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df = df.sort_values("timestamp").reset_index(drop=True)
-    return df[["timestamp", "price"]]
+        for lo, hi in ranges
+    ]
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+        frames = [df for df in executor.map(_cached_price_frame, urls) if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames, ignore_index=True)
+    return df.sort_values("timestamp").reset_index(drop=True)
 
 
 def forecast_next_hour(prices: pd.DataFrame, window: int = 24) -> float:
@@ -140,49 +184,93 @@ def forecast_next_hour(prices: pd.DataFrame, window: int = 24) -> float:
     return prices["price"].tail(window).mean()
 
 
-def forecast_arima(prices: pd.DataFrame, order: Optional[tuple] = None) -> float:
+def _arima_aic(task: tuple) -> tuple:
+    """Fit one ``(values, order)`` task and return ``(aic, order)``.
+
+    Failed or undefined fits score ``inf``. Defined at module level so the
+    grid search can send it to worker processes.
+    """
+    values, order = task
+    try:
+        model = ARIMA(values, order=order,
+                      enforce_stationarity=False,
+                      enforce_invertibility=False)
+        aic = model.fit().aic
+    except Exception:
+        return float("inf"), order
+    return (float("inf") if np.isnan(aic) else aic), order
+
+
+def _select_arima_order(series: pd.Series, n_jobs: Optional[int] = 1) -> tuple:
+    """Choose the (p, d, q) order with the lowest AIC from a small grid.
+
+    With ``n_jobs`` other than 1 the candidate models are fitted in a process
+    pool of that many workers (``None`` uses every CPU).
+    """
+    orders = [
+        (p, d, q)
+        for p in range(0, 3)
+        for d in range(0, 2)
+        for q in range(0, 3)
+        if not p == d == q == 0
+    ]
+    tasks = [(series.to_numpy(), order) for order in orders]
+    if n_jobs == 1:
+        results = list(map(_arima_aic, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(_arima_aic, tasks))
+
+    # Ties go to the first order in grid order, as min() compares orders next
+    best_aic, best_order = min(results)
+    if best_aic == float("inf"):
+        return (1, 0, 0)
+    return best_order
+
+
+def _check_arima_order(order) -> None:
+    """Raise ``ValueError`` unless ``order`` is a (p, d, q) tuple or ``"auto"``."""
+    if order is None or (isinstance(order, str) and order != "auto"):
+        raise ValueError(
+            f'ARIMA order must be a (p, d, q) tuple or "auto", got {order!r}'
+        )
+
+
+def forecast_arima(
+    prices: pd.DataFrame,
+    order: Union[tuple, str] = (1, 0, 0),
+    *,
+    n_jobs: Optional[int] = 1,
+) -> float:
     """Forecast the next hour's price using an ARIMA model.
 
     Parameters
     ----------
     prices : pandas.DataFrame
         DataFrame produced by :func:`fetch_recent_prices`.
-    order : tuple, optional
-        (p, d, q) order of the ARIMA model. If not provided, a small grid search
-        is performed to choose a reasonable order based on AIC.
+    order : tuple or "auto", optional
+        (p, d, q) order of the ARIMA model. Defaults to ``(1, 0, 0)``, which
+        needs a single model fit. Pass ``"auto"`` to choose the order by a
+        small grid search on AIC instead (17 fits). ``None`` and other
+        strings are rejected with ``ValueError``.
+    n_jobs : int, optional
+        Number of worker processes for the ``"auto"`` grid search. Defaults to 1
+        (sequential); ``None`` uses every CPU. Parallel fitting pays off for
+        long price histories, where each candidate fit is expensive.
 
     Returns
     -------
     float
         Forecasted price for the next hour.
     """
+    _check_arima_order(order)
     if prices.empty:
         raise ValueError("No price data available for forecasting")
 
     series = prices["price"].astype(float)
 
-    if order is None:
-        best_aic = float("inf")
-        best_order = (1, 0, 0)
-        p_range = range(0, 3)
-        d_range = range(0, 2)
-        q_range = range(0, 3)
-        for p in p_range:
-            for d in d_range:
-                for q in q_range:
-                    if p == d == q == 0:
-                        continue
-                    try:
-                        model = ARIMA(series, order=(p, d, q),
-                                      enforce_stationarity=False,
-                                      enforce_invertibility=False)
-                        res = model.fit()
-                        if res.aic < best_aic:
-                            best_aic = res.aic
-                            best_order = (p, d, q)
-                    except Exception:
-                        continue
-        order = best_order
+    if order == "auto":
+        order = _select_arima_order(series, n_jobs=n_jobs)
 
     model = ARIMA(series, order=order,
                   enforce_stationarity=False,
@@ -209,13 +297,37 @@ def forecast_next_day_seasonal(prices: pd.DataFrame) -> float:
     if prices.empty:
         raise ValueError("No price data available for forecasting")
 
-    df = prices.copy()
-    df["dayofyear"] = df["timestamp"].dt.dayofyear
-    day_means = df.groupby("dayofyear")["price"].mean()
-    next_day = (df["timestamp"].max() + pd.Timedelta(days=1)).dayofyear
-    if next_day in day_means.index:
-        return float(day_means.loc[next_day])
-    return float(df["price"].mean())
+    price = prices["price"].to_numpy(dtype=float)
+    dayofyear = prices["timestamp"].dt.dayofyear.to_numpy()
+    valid = ~np.isnan(price)
+    # Per-day-of-year sums and counts in one pass; missing prices are skipped
+    sums = np.bincount(dayofyear[valid], weights=price[valid], minlength=367)
+    counts = np.bincount(dayofyear[valid], minlength=367)
+    next_day = (prices["timestamp"].max() + pd.Timedelta(days=1)).dayofyear
+    if counts[next_day]:
+        return float(sums[next_day] / counts[next_day])
+    return float(prices["price"].mean())
+
+
+def _backcast_moving_average(prices: pd.DataFrame, price: np.ndarray, window: int) -> pd.DataFrame:
+    """Vectorized :func:`backcast` of :func:`forecast_next_hour`.
+
+    Each forecast averages the last ``min(window, 24)`` prices of its
+    history window. Every moving sum is the difference of two running
+    totals, so the whole backcast costs O(n) instead of O(n * window) and no
+    DataFrame is sliced per step.
+    """
+    # forecast_next_hour averages at most its default 24 rows of the history
+    span = min(window, 24)
+    totals = np.concatenate([[0.0], np.cumsum(price[:-1])])  # totals[k] = sum(price[:k])
+    predicted = (totals[window:] - totals[window - span:price.size - span]) / span
+    actual = price[window:]
+    return pd.DataFrame({
+        "timestamp": prices["timestamp"].iloc[window:].reset_index(drop=True),
+        "actual": actual,
+        "predicted": predicted,
+        "error": actual - predicted,
+    })
 
 
 def backcast(
@@ -223,6 +335,7 @@ def backcast(
     forecast_func,
     *,
     window: int = 24,
+    order: Union[tuple, str, None] = None,
 ) -> pd.DataFrame:
     """Evaluate a forecasting function using backcasting.
 
@@ -236,6 +349,12 @@ def backcast(
     window : int, optional
         Number of rows of historical data to use for each forecast. Defaults to
         24.
+    order : tuple or "auto", optional
+        (p, d, q) order to use with :func:`forecast_arima`. Leaving it as
+        ``None`` keeps that function's default order of ``(1, 0, 0)``. With
+        ``"auto"`` the order is chosen once by grid search on the first
+        window and reused for every step, rather than searched again for
+        each overlapping window. Only valid with :func:`forecast_arima`.
 
     Returns
     -------
@@ -244,20 +363,35 @@ def backcast(
         ``error`` columns for each backcast step.
     """
 
+    if window < 1:
+        raise ValueError("window must be at least 1")
     if len(prices) <= window:
         raise ValueError("Not enough data for backcasting")
 
-    records = []
-    for i in range(window, len(prices)):
-        history = prices.iloc[i - window : i]
-        predicted = float(forecast_func(history))
-        actual = float(prices["price"].iloc[i])
-        ts = prices["timestamp"].iloc[i]
-        records.append({
-            "timestamp": ts,
-            "actual": actual,
-            "predicted": predicted,
-            "error": actual - predicted,
-        })
-
-    return pd.DataFrame(records)
+    price = prices["price"].to_numpy(dtype=float)
+    if forecast_func is forecast_arima:
+        if order is not None:
+            _check_arima_order(order)
+        if order == "auto":
+            first_window = prices["price"].iloc[:window].astype(float)
+            order = _select_arima_order(first_window)
+        if order is not None:
+            forecast_func = partial(forecast_arima, order=order)
+    elif order is not None:
+        raise ValueError("order is only supported when backcasting forecast_arima")
+    elif forecast_func is forecast_next_hour:
+        # Missing prices need pandas' NaN-skipping mean, and an inf would
+        # poison every later running total, so non-finite series use the loop
+        if np.isfinite(price).all():
+            return _backcast_moving_average(prices, price, window)
+
+    predicted = np.empty(len(prices) - window)
+    for k, i in enumerate(range(window, len(prices))):
+        predicted[k] = forecast_func(prices.iloc[i - window : i])
+    actual = price[window:]
+    return pd.DataFrame({
+        "timestamp": prices["timestamp"].iloc[window:].reset_index(drop=True),
+        "actual": actual,
+        "predicted": predicted,
+        "error": actual - predicted,
+    })
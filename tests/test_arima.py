@@ -1,18 +1,54 @@
 import pandas as pd
+import pytest
 import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 
-from price_utils import forecast_arima
+import price_utils
+from price_utils import forecast_arima, backcast
 
 
 def test_forecast_arima_constant():
     # Constant price should forecast same value
     data = pd.DataFrame({
-        "timestamp": pd.date_range("2024-01-01", periods=30, freq="H"),
+        "timestamp": pd.date_range("2024-01-01", periods=30, freq="h"),
         "price": [5.0]*30
     })
     forecast = forecast_arima(data, order=(1,0,0))
     assert abs(forecast - 5.0) < 1e-1
+
+
+def test_forecast_arima_parallel_grid_matches_sequential():
+    data = pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=30, freq="h"),
+        "price": [5.0 + 0.1 * (i % 7) for i in range(30)],
+    })
+    sequential = forecast_arima(data, order="auto")
+    parallel = forecast_arima(data, order="auto", n_jobs=2)
+    assert abs(sequential - parallel) < 1e-9
+
+
+def test_forecast_arima_default_order_skips_grid_search(monkeypatch):
+    def select(series, n_jobs=1):
+        raise AssertionError("grid search should not run")
+
+    monkeypatch.setattr(price_utils, "_select_arima_order", select)
+    data = pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=30, freq="h"),
+        "price": [5.0 + 0.1 * (i % 7) for i in range(30)],
+    })
+    assert forecast_arima(data) == forecast_arima(data, order=(1, 0, 0))
+
+
+def test_forecast_arima_rejects_invalid_order():
+    data = pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=30, freq="h"),
+        "price": [5.0] * 30,
+    })
+    for order in (None, "Auto", "grid"):
+        with pytest.raises(ValueError, match="auto"):
+            forecast_arima(data, order=order)
+    with pytest.raises(ValueError, match="auto"):
+        backcast(data, forecast_arima, window=24, order="Auto")
@@ -1,17 +1,61 @@
 import pandas as pd
+import pytest
 import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 
-from price_utils import forecast_next_hour, backcast
+import price_utils
+from price_utils import forecast_next_hour, forecast_arima, backcast
 
 
 def test_backcast_constant_series():
-    timestamps = pd.date_range("2024-01-01", periods=30, freq="H")
+    timestamps = pd.date_range("2024-01-01", periods=30, freq="h")
     prices = pd.DataFrame({"timestamp": timestamps, "price": 5.0})
     result = backcast(prices, forecast_next_hour, window=24)
     assert len(result) == 6
     assert all(abs(result["predicted"] - 5.0) < 1e-6)
     assert all(abs(result["error"]) < 1e-6)
+
+
+def test_backcast_arima_selects_order_once(monkeypatch):
+    calls = []
+
+    def select(series, n_jobs=1):
+        calls.append(len(series))
+        return (1, 0, 0)
+
+    monkeypatch.setattr(price_utils, "_select_arima_order", select)
+    timestamps = pd.date_range("2024-01-01", periods=30, freq="h")
+    prices = pd.DataFrame({"timestamp": timestamps, "price": 5.0})
+    result = backcast(prices, forecast_arima, window=24, order="auto")
+    assert calls == [24]
+    assert all(abs(result["predicted"] - 5.0) < 1e-1)
+
+
+def test_backcast_moving_average_matches_generic_loop():
+    timestamps = pd.date_range("2024-01-01", periods=100, freq="h")
+    prices = pd.DataFrame({"timestamp": timestamps,
+                           "price": [float((i * 37) % 11) for i in range(100)]})
+    for window in (12, 24, 48):
+        fast = backcast(prices, forecast_next_hour, window=window)
+        # A wrapper is not recognised as forecast_next_hour, so it takes the loop
+        slow = backcast(prices, lambda h: forecast_next_hour(h), window=window)
+        pd.testing.assert_frame_equal(fast, slow)
+
+
+def test_backcast_moving_average_recovers_after_inf():
+    timestamps = pd.date_range("2024-01-01", periods=60, freq="h")
+    prices = pd.DataFrame({"timestamp": timestamps, "price": 5.0})
+    prices.loc[10, "price"] = float("inf")
+    result = backcast(prices, forecast_next_hour, window=24)
+    # Once the inf has left the 24-hour window the forecasts are finite again
+    assert all(abs(result["predicted"].iloc[11:] - 5.0) < 1e-12)
+
+
+def test_backcast_rejects_empty_window():
+    timestamps = pd.date_range("2024-01-01", periods=30, freq="h")
+    prices = pd.DataFrame({"timestamp": timestamps, "price": 5.0})
+    with pytest.raises(ValueError):
+        backcast(prices, forecast_next_hour, window=0)
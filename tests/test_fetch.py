@@ -0,0 +1,101 @@
+import json
+import pandas as pd
+import sys
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+import price_utils
+from price_utils import fetch_daily_prices, fetch_recent_prices
+
+
+class _FakeResponse:
+    payload = {
+        "response": {
+            "data": [
+                {"timestamp": "2024-01-01T01", "value": 31.0},
+                {"timestamp": "2024-01-01T00", "value": 30.0},
+            ]
+        }
+    }
+    content = json.dumps(payload).encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def utcnow(cls):
+        return cls(2024, 1, 1, 12, 30)
+
+
+def _freeze_clock(monkeypatch):
+    # Query URLs embed the current hour/day and cache keys the current TTL
+    # bucket, so pin both to keep the tests independent of the wall clock
+    monkeypatch.setattr(price_utils, "datetime", _FixedDatetime)
+    monkeypatch.setattr(price_utils.time, "time", lambda: 1_704_112_200.0)
+
+
+def test_fetch_reuses_cached_response(monkeypatch):
+    calls = []
+
+    def fake_get(url, timeout):
+        calls.append(url)
+        return _FakeResponse()
+
+    _freeze_clock(monkeypatch)
+    price_utils._fetch_price_frame.cache_clear()
+    monkeypatch.setattr(price_utils._SESSION, "get", fake_get)
+    first = fetch_recent_prices("NY", api_key="test-key")
+    first.loc[0, "price"] = -1.0
+    second = fetch_recent_prices("NY", api_key="test-key")
+    price_utils._fetch_price_frame.cache_clear()
+
+    assert len(calls) == 1
+    assert list(second["price"]) == [30.0, 31.0]
+
+
+def test_fetch_daily_prices_splits_years(monkeypatch):
+    ranges = []
+
+    class _RangeResponse:
+        def __init__(self, start, end):
+            self.payload = {"response": {"data": [
+                {"timestamp": end, "value": 2.0},
+                {"timestamp": start, "value": 1.0},
+            ]}}
+            self.content = json.dumps(self.payload).encode()
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return self.payload
+
+    def fake_get(url, timeout):
+        query = parse_qs(urlparse(url).query)
+        start, end = query["start"][0], query["end"][0]
+        ranges.append((start, end))
+        return _RangeResponse(start, end)
+
+    _freeze_clock(monkeypatch)
+    price_utils._fetch_price_frame.cache_clear()
+    monkeypatch.setattr(price_utils._SESSION, "get", fake_get)
+    df = fetch_daily_prices("NY", years=3, api_key="test-key")
+    price_utils._fetch_price_frame.cache_clear()
+
+    ranges.sort()
+    assert ranges[0][0] == "2021-01-01" and ranges[-1][1] == "2024-01-01"
+    assert len(ranges) == 3
+    for (_, prev_end), (next_start, _) in zip(ranges, ranges[1:]):
+        gap = pd.Timestamp(next_start) - pd.Timestamp(prev_end)
+        assert gap == pd.Timedelta(days=1)
+    assert len(df) == 6
+    assert df["timestamp"].is_monotonic_increasing
@@ -1,3 +1,5 @@
+import math
+import numpy as np
 import pandas as pd
 import sys
 from pathlib import Path
@@ -5,7 +7,15 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 
-from plant import calculate_npv, calculate_lcoe, calculate_discounted_payback_period
+import plant
+from plant import (
+    calculate_npv,
+    calculate_npv_batch,
+    calculate_lcoe,
+    calculate_lcoe_batch,
+    calculate_irr,
+    calculate_discounted_payback_period,
+)
 from price_utils import forecast_next_hour, forecast_next_day_seasonal
 
 
@@ -15,6 +25,7 @@ def test_calculate_npv():
     # NPV = -100/(1+0.1)^1 + 60/(1+0.1)^2 + 60/(1+0.1)^3
     expected = cash_flows[0] / 1.1 + cash_flows[1] / 1.1**2 + cash_flows[2] / 1.1**3
     assert abs(npv - expected) < 1e-8
+    assert calculate_npv(cash_flows, np.array(0.1)) == npv
 
 
 def test_calculate_lcoe():
@@ -29,14 +40,92 @@ def test_calculate_lcoe():
     assert abs(lcoe - expected) < 1e-8
 
 
+def test_float32_matches_float64():
+    years = 50
+    invest = [1e9] * 5 + [0.0] * (years - 5)
+    op = [0.0] * 5 + [4e7] * (years - 5)
+    energy = [0.0] * 5 + [8e6] * (years - 5)
+    lcoe64 = calculate_lcoe(invest, op, energy, 0.07, residual_value=2e8)
+    lcoe32 = calculate_lcoe(invest, op, energy, 0.07, residual_value=2e8, dtype=np.float32)
+    assert abs(lcoe32 / lcoe64 - 1) < 1e-6
+    cash_flows = [-100, 60, 60]
+    assert abs(calculate_npv(cash_flows, 0.1, dtype=np.float32) - calculate_npv(cash_flows, 0.1)) < 1e-4
+
+
+def test_discount_factors_shared_across_functions():
+    plant._cached_discount_factors.cache_clear()
+    calculate_npv([-100, 60, 60], 0.07)
+    calculate_discounted_payback_period([-100, 60, 60], 0.07)
+    calculate_lcoe([50, 0, 0], [0, 10, 10], [0, 100, 100], 0.07)
+    info = plant._cached_discount_factors.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_calculate_npv_batch():
+    cash_flows = [[-100, 60, 60], [-50, 10, 80]]
+    rates = [0.0, 0.05, 0.1]
+    result = calculate_npv_batch(cash_flows, rates)
+    assert result.shape == (2, 3)
+    for i, flows in enumerate(cash_flows):
+        for j, rate in enumerate(rates):
+            assert abs(result[i, j] - calculate_npv(flows, rate)) < 1e-8
+
+
+def test_calculate_lcoe_batch():
+    invest, op, energy = [50, 0, 0], [0, 10, 10], [0, 100, 120]
+    rates = [0.03, 0.1]
+    result = calculate_lcoe_batch(invest, op, energy, rates, residual_value=5)
+    expected = [calculate_lcoe(invest, op, energy, r, residual_value=5) for r in rates]
+    assert np.allclose(result, expected, rtol=1e-12)
+    assert np.isinf(calculate_lcoe_batch(invest, op, [0, 0, 0], rates)).all()
+    assert np.isinf(calculate_lcoe_batch([], [], [], rates)).all()
+    assert calculate_lcoe_batch(invest, op, energy, 0.1).shape == ()
+    assert calculate_npv_batch([[-100, 60, 60], [-50, 10, 80]], 0.1).shape == (2,)
+
+
+def test_calculate_irr():
+    cash_flows = [-100, 60, 60]
+    irr = calculate_irr(cash_flows)
+    # -100 + 60x + 60x^2 = 0 with x = 1/(1+irr)
+    x = (-60 + math.sqrt(60**2 + 4 * 60 * 100)) / (2 * 60)
+    assert abs(irr - (1 / x - 1)) < 1e-8
+
+
+def test_calculate_irr_no_solution():
+    assert math.isnan(calculate_irr([10, 20, 30]))
+    assert math.isnan(calculate_irr([0, 0, 0]))
+    assert calculate_irr([0, 100, -100]) == 0.0
+
+
+def test_calculate_irr_close_roots():
+    # Investment, inflows, then decommissioning: the NPV is positive only
+    # between 8.485% and 8.678%, a gap narrower than one scan step
+    cash_flows = [-1000.0] * 5 + [1153.66] * 19 + [-24365.58]
+    assert abs(calculate_irr(cash_flows) - 0.0848468586850) < 1e-9
+
+
+def test_calculate_irr_double_root():
+    # -4 + 4x - x**2 = -(x - 2)**2 with x = 1 / (1 + r) never changes sign
+    assert abs(calculate_irr([-4, 4, -1, 0]) + 0.5) < 1e-9
+
+
 def test_discounted_payback_period():
     cash_flows = [-100, 40, 40, 40]
     dpp = calculate_discounted_payback_period(cash_flows, 0.05)
     assert dpp == 3
 
 
+def test_discounted_payback_matches_npv():
+    cash_flows = [-100, 30, 40, 50, 60]
+    dpp = calculate_discounted_payback_period(cash_flows, 0.07)
+    # Payback is the first period whose cumulative NPV is non-negative
+    assert calculate_npv(cash_flows[:dpp + 1], 0.07) >= 0
+    assert calculate_npv(cash_flows[:dpp], 0.07) < 0
+    assert calculate_discounted_payback_period([-100, 10, 10], 0.07) is None
+
+
 def test_forecast_next_hour():
-    timestamps = pd.date_range("2024-01-01", periods=24, freq="H")
+    timestamps = pd.date_range("2024-01-01", periods=24, freq="h")
     prices = pd.DataFrame({"timestamp": timestamps, "price": range(24)})
     assert forecast_next_hour(prices) == sum(range(0,24))/24
 
@@ -46,3 +135,11 @@ def test_forecast_next_day_seasonal():
     prices = pd.DataFrame({"timestamp": timestamps, "price": 2.0})
     # All prices the same -> forecast should equal that price
     assert forecast_next_day_seasonal(prices) == 2.0
+
+
+def test_forecast_next_day_seasonal_uses_same_day_of_year():
+    timestamps = pd.date_range("2022-01-01", "2023-06-30", freq="D")
+    prices = pd.DataFrame({"timestamp": timestamps, "price": timestamps.dayofyear.astype(float)})
+    prices.loc[prices["timestamp"] == "2022-07-01", "price"] = 100.0
+    # July 1st is day 182 and only appears once, in 2022
+    assert forecast_next_day_seasonal(prices) == 100.0
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import sys
 from pathlib import Path
@@ -5,11 +6,11 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 
-from plant import simulate_plant_operation
+from plant import simulate_plant_operation, _online_hours_by_year
 
 
 def test_simulate_plant_operation():
-    timestamps = pd.date_range("2024-01-01", periods=48, freq="H")
+    timestamps = pd.date_range("2024-01-01", periods=48, freq="h")
     prices = pd.DataFrame({"timestamp": timestamps, "price": 50.0})
     profit, _ = simulate_plant_operation(prices, capacity_mw=1000,
                                          fuel_cost_per_mwh=10,
@@ -21,7 +22,7 @@ def test_simulate_plant_operation():
     assert abs(profit - expected) < 1e-6
 
 def test_simulate_refueling_cost():
-    timestamps = pd.date_range("2024-01-01", periods=48, freq="H")
+    timestamps = pd.date_range("2024-01-01", periods=48, freq="h")
     prices = pd.DataFrame({"timestamp": timestamps, "price": 50.0})
     hours_per_cycle = 18 * 30 * 24
     energy_cycle = 1000 * 1.0 * hours_per_cycle
@@ -37,3 +38,58 @@ def test_simulate_refueling_cost():
     energy = 24 * 1000
     expected = (50.0 * energy) - (10 * energy)
     assert abs(profit_mwh - expected) < 1e-6
+
+
+def test_simulate_repeated_maintenance():
+    # Three yearly outages of two days each within 2024-2026
+    timestamps = pd.date_range("2024-01-01", "2026-12-31 23:00", freq="h")
+    prices = pd.DataFrame({"timestamp": timestamps, "price": 1.0})
+    _, results = simulate_plant_operation(prices, capacity_mw=1,
+                                          maintenance_days=2,
+                                          capacity_factor=1.0)
+    offline = results.loc[results["energy_mwh"] == 0.0, "timestamp"]
+    assert len(offline) == 3 * 48
+    assert sorted(set(offline.dt.year)) == [2024, 2025, 2026]
+    assert (offline.dt.month == 1).all() and (offline.dt.day <= 2).all()
+
+
+def test_simulate_profit_only():
+    timestamps = pd.date_range("2024-01-01", periods=48, freq="h")
+    prices = pd.DataFrame({"timestamp": timestamps, "price": 50.0})
+    kwargs = dict(capacity_mw=1000, fuel_cost_per_mwh=10, maintenance_days=1)
+    profit, _ = simulate_plant_operation(prices, **kwargs)
+    assert simulate_plant_operation(prices, return_dataframe=False, **kwargs) == profit
+
+
+def test_online_hours_match_simulation():
+    hours = 5 * 365 * 24
+    timestamps = pd.date_range("2024-01-01", periods=hours, freq="h")
+    prices = pd.DataFrame({"timestamp": timestamps, "price": 1.0})
+    # Yearly-ish outages, and monthly outages long enough to overlap
+    for days, months in [(30, 18), (40, 1)]:
+        _, results = simulate_plant_operation(prices, capacity_mw=1,
+                                              maintenance_days=days,
+                                              capacity_factor=1.0,
+                                              maintenance_interval_months=months)
+        simulated = results.groupby(results["timestamp"].dt.year)["energy_mwh"].sum()
+        online = _online_hours_by_year("2024-01-01", hours, days, months)
+        assert np.array_equal(online, simulated.to_numpy())
+
+
+def test_simulate_unsorted_prices():
+    timestamps = pd.date_range("2024-01-01", periods=48, freq="h")
+    prices = pd.DataFrame({"timestamp": timestamps, "price": np.arange(48.0)})
+    shuffled = prices.sample(frac=1.0, random_state=0)
+    kwargs = dict(capacity_mw=1, maintenance_days=1, capacity_factor=1.0)
+    profit, results = simulate_plant_operation(shuffled, **kwargs)
+    expected, sorted_results = simulate_plant_operation(prices, **kwargs)
+    assert profit == expected
+    assert results["timestamp"].is_monotonic_increasing
+    # The caller's frames are left unchanged, including by edits to the results
+    results.loc[0, "price"] = -1.0
+    sorted_results.loc[0, "price"] = -1.0
+    sorted_results.loc[0, "timestamp"] = pd.Timestamp("2000-01-01")
+    assert list(prices.columns) == list(shuffled.columns) == ["timestamp", "price"]
+    assert prices["price"].tolist() == list(np.arange(48.0))
+    assert prices["timestamp"].equals(pd.Series(timestamps))
+    assert sorted(shuffled["price"]) == list(np.arange(48.0))